@@ -58,16 +58,13 @@ const mergeProfileData = (existingProfile, newProfile) => {
     if (newProfile.about) {
         merged.about = merged.about || {};
         if (newProfile.about.work) {
-            merged.about.work = [...(merged.about.work || []), ...newProfile.about.work]
-                .filter((item, index, arr) => arr.indexOf(item) === index); // Remove duplicates
+            merged.about.work = [...new Set([...(merged.about.work || []), ...newProfile.about.work])]; // Remove duplicates (Set keeps first-seen order)
         }
         if (newProfile.about.education) {
-            merged.about.education = [...(merged.about.education || []), ...newProfile.about.education]
-                .filter((item, index, arr) => arr.indexOf(item) === index);
+            merged.about.education = [...new Set([...(merged.about.education || []), ...newProfile.about.education])];
         }
         if (newProfile.about.location) {
-            merged.about.location = [...(merged.about.location || []), ...newProfile.about.location]
-                .filter((item, index, arr) => arr.indexOf(item) === index);
+            merged.about.location = [...new Set([...(merged.about.location || []), ...newProfile.about.location])];
         }
         if (newProfile.about.relationship) merged.about.relationship = newProfile.about.relationship;
         if (newProfile.about.bio) merged.about.bio = newProfile.about.bio;
@@ -137,8 +134,16 @@ const mergeProfileData = (existingProfile, newProfile) => {
 router.get('/next', (req, res) => {
     try {
         const queueFile = path.join(DATA_DIR, 'queue.json');
-        const queue = readJSON(queueFile) || [];
+        const storedQueue = readJSON(queueFile) || [];
+        const visited = new Set(readJSON(path.join(DATA_DIR, 'visited.json')) || []);
         const maxDepth = parseInt(req.query.maxDepth) || 5; // Default to 5 if not specified
+
+        // Drop URLs that were scraped after being queued so they aren't fetched twice
+        const queue = storedQueue.filter(item => !visited.has(item.url));
+        if (queue.length !== storedQueue.length) {
+            console.log(`Skipping ${storedQueue.length - queue.length} already visited URLs in queue`);
+            writeJSON(queueFile, queue);
+        }
         
         if (queue.length === 0) {
             return res.json({ url: null, message: 'Queue is empty' });
@@ -258,9 +263,10 @@ router.get('/profiles', (req, res) => {
             }
         });
 
-        // Apply limit if specified
+        // Apply limit if specified (parsed once up front; the isNaN guard keeps the original validation)
+        const maxProfiles = parseInt(limit, 10);
         if (limit && !isNaN(limit)) {
-            profiles = profiles.slice(0, parseInt(limit));
+            profiles = profiles.slice(0, maxProfiles);
         }
 
         res.json({
@@ -358,7 +364,8 @@ router.post('/set-seed', (req, res) => {
             if (updatedProfile.friends && updatedProfile.friends.length > 0) {
                 const queuePath = path.join(DATA_DIR, 'queue.json');
                 const queue = readJSON(queuePath) || [];
-                const visited = readJSON(path.join(DATA_DIR, 'visited.json')) || [];
+                const visited = new Set(readJSON(path.join(DATA_DIR, 'visited.json')) || []);
+                const queuedUrls = new Set(queue.map(item => item.url));
                 
                 // Extract friend URLs
                 const friendUrls = updatedProfile.friends.map(friend => friend.url);
@@ -367,13 +374,14 @@ router.post('/set-seed', (req, res) => {
                 // Add friends to queue at depth 2
                 friendUrls.forEach(url => {
                     // Skip if already visited or in queue
-                    if (!visited.includes(url) && !queue.some(item => item.url === url)) {
+                    if (!visited.has(url) && !queuedUrls.has(url)) {
                         queue.push({
                             url: url,
                             depth: 2, // Depth 2 since the seed is depth 1
                             added_at: new Date().toISOString(),
                             source: `seed:${updatedProfile.url}`
                         });
+                        queuedUrls.add(url);
                         addedCount++;
                     }
                 });
@@ -431,8 +439,8 @@ router.post('/fix-friends-depth', (req, res) => {
             return res.json({ success: true, fixed: 0, message: 'No friends found for this profile' });
         }
 
-        // Get friend URLs
-        const friendUrls = profile.friends.map(f => f.url).filter(url => url);
+        // Get friend URLs (as a Set so each queue item is an O(1) lookup)
+        const friendUrls = new Set(profile.friends.map(f => f.url).filter(url => url));
         const wrongDepth = oldDepth + 1;
         const correctDepth = newDepth + 1;
         
@@ -440,7 +448,7 @@ router.post('/fix-friends-depth', (req, res) => {
 
         // Update depth for friends in queue
         queue.forEach(item => {
-            if (friendUrls.includes(item.url) && item.depth === wrongDepth) {
+            if (friendUrls.has(item.url) && item.depth === wrongDepth) {
                 console.log(`   Fixing: ${item.url} depth ${wrongDepth} → ${correctDepth}`);
                 item.depth = correctDepth;
                 item.depth_fixed_at = new Date().toISOString();
@@ -455,7 +463,7 @@ router.post('/fix-friends-depth', (req, res) => {
             res.json({ 
                 success: true, 
                 fixed: fixedCount,
-                friendsTotal: friendUrls.length,
+                friendsTotal: friendUrls.size,
                 wrongDepth: wrongDepth,
                 correctDepth: correctDepth
             });
@@ -498,13 +506,13 @@ router.post('/fix-all-depths', (req, res) => {
                 const profileDepth = profile.depth || 1;
                 const expectedFriendDepth = profileDepth + 1;
                 
-                // Get friend URLs
-                const friendUrls = profile.friends.map(f => f.url).filter(url => url);
+                // Get friend URLs (as a Set so each queue item is an O(1) lookup)
+                const friendUrls = new Set(profile.friends.map(f => f.url).filter(url => url));
                 let fixedForThisProfile = 0;
                 
                 // Check and fix friends in queue
                 queue.forEach(item => {
-                    if (friendUrls.includes(item.url)) {
+                    if (friendUrls.has(item.url)) {
                         if (item.depth !== expectedFriendDepth) {
                             console.log(`   Fixing: ${item.url} depth ${item.depth} → ${expectedFriendDepth} (friend of ${profile.name})`);
                             item.original_depth = item.depth;
@@ -576,11 +584,11 @@ router.get('/validate-depths', (req, res) => {
                 
                 const profileDepth = profile.depth || 1;
                 const expectedFriendDepth = profileDepth + 1;
-                const friendUrls = profile.friends.map(f => f.url).filter(url => url);
+                const friendUrls = new Set(profile.friends.map(f => f.url).filter(url => url));
                 
                 // Check friends in queue
                 queue.forEach(item => {
-                    if (friendUrls.includes(item.url)) {
+                    if (friendUrls.has(item.url)) {
                         validatedCount++;
                         if (item.depth !== expectedFriendDepth) {
                             issues.push(
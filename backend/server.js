@@ -37,8 +37,8 @@ const ALIASES_FILE = path.join(DATA_DIR, 'aliases.json');
 const MANUAL_CONNECTIONS_FILE = path.join(DATA_DIR, 'manual_connections.json');
 const SETTINGS_FILE = path.join(DATA_DIR, 'settings.json');
 
-// Ensure data directories exist
-if (!fs.existsSync(DATA_DIR)) fs.mkdirSync(DATA_DIR, { recursive: true });
+// Ensure data directories exist (PROFILES_DIR is the only leaf; recursive mkdir creates DATA_DIR too).
+// Checking the leaf first keeps the usual warm start to a single stat.
 if (!fs.existsSync(PROFILES_DIR)) fs.mkdirSync(PROFILES_DIR, { recursive: true });
 
 // Initialize data files if they don't exist
@@ -100,9 +100,10 @@ const readJSON = (filePath) => {
     }
 };
 
-const writeJSON = (filePath, data) => {
+// Large machine-read files (graph, aliases) are written with indent 0 to skip pretty-printing
+const writeJSON = (filePath, data, indent = 2) => {
     try {
-        fs.writeFileSync(filePath, JSON.stringify(data, null, 2));
+        fs.writeFileSync(filePath, JSON.stringify(data, null, indent));
         return true;
     } catch (error) {
         console.error(`Error writing ${filePath}:`, error);
@@ -110,22 +111,26 @@ const writeJSON = (filePath, data) => {
     }
 };
 
+// Settings only change through POST /api/settings, so keep the parsed copy in memory
+let cachedSettings = null;
+const readSettings = () => {
+    if (cachedSettings === null) cachedSettings = readJSON(SETTINGS_FILE);
+    return cachedSettings;
+};
+
 // Name similarity and alias detection functions
-const calculateNameSimilarity = (name1, name2) => {
-    if (!name1 || !name2) return 0;
-    
-    // Normalize names (lowercase, remove extra spaces, common prefixes/suffixes)
-    const normalize = (name) => {
-        return name.toLowerCase()
-            .replace(/\s+/g, ' ')
-            .trim()
-            .replace(/^(mr|mrs|ms|dr|prof)\.?\s+/i, '')
-            .replace(/\s+(jr|sr|ii|iii|iv)\.?$/i, '');
-    };
-    
-    const n1 = normalize(name1);
-    const n2 = normalize(name2);
-    
+
+// Normalize names (lowercase, remove extra spaces, common prefixes/suffixes)
+const normalizeName = (name) => {
+    return name.toLowerCase()
+        .replace(/\s+/g, ' ')
+        .trim()
+        .replace(/^(mr|mrs|ms|dr|prof)\.?\s+/i, '')
+        .replace(/\s+(jr|sr|ii|iii|iv)\.?$/i, '');
+};
+
+// Similarity of two names that have already been through normalizeName()
+const compareNormalizedNames = (n1, n2) => {
     if (n1 === n2) return 1.0;
     
     // Check for exact word matches (different order)
@@ -168,6 +173,8 @@ const levenshteinSimilarity = (str1, str2) => {
 const detectSimilarNames = (profiles, threshold = 0.7) => {
     const similarPairs = [];
     const profilesList = Object.entries(profiles);
+    // Normalize each name once rather than once per pair
+    const normalizedNames = profilesList.map(([, profile]) => profile.name ? normalizeName(profile.name) : null);
     
     for (let i = 0; i < profilesList.length; i++) {
         for (let j = i + 1; j < profilesList.length; j++) {
@@ -175,7 +182,7 @@ const detectSimilarNames = (profiles, threshold = 0.7) => {
             const [url2, profile2] = profilesList[j];
             
             if (profile1.name && profile2.name) {
-                const similarity = calculateNameSimilarity(profile1.name, profile2.name);
+                const similarity = compareNormalizedNames(normalizedNames[i], normalizedNames[j]);
                 
                 if (similarity >= threshold) {
                     similarPairs.push({
@@ -224,22 +231,19 @@ const mergeProfileData = (existingProfile, newProfile) => {
         
         if (newProfile.about.work) {
             const oldWork = merged.about.work || [];
-            merged.about.work = [...oldWork, ...newProfile.about.work]
-                .filter((item, index, arr) => arr.indexOf(item) === index); // Remove duplicates
+            merged.about.work = [...new Set([...oldWork, ...newProfile.about.work])]; // Remove duplicates (Set keeps first-seen order)
             console.log(`💼 Work info updated: ${oldWork.length} -> ${merged.about.work.length} items`);
             aboutUpdated = true;
         }
         if (newProfile.about.education) {
             const oldEducation = merged.about.education || [];
-            merged.about.education = [...oldEducation, ...newProfile.about.education]
-                .filter((item, index, arr) => arr.indexOf(item) === index);
+            merged.about.education = [...new Set([...oldEducation, ...newProfile.about.education])];
             console.log(`🎓 Education info updated: ${oldEducation.length} -> ${merged.about.education.length} items`);
             aboutUpdated = true;
         }
         if (newProfile.about.location) {
             const oldLocation = merged.about.location || [];
-            merged.about.location = [...oldLocation, ...newProfile.about.location]
-                .filter((item, index, arr) => arr.indexOf(item) === index);
+            merged.about.location = [...new Set([...oldLocation, ...newProfile.about.location])];
             console.log(`📍 Location info updated: ${oldLocation.length} -> ${merged.about.location.length} items`);
             aboutUpdated = true;
         }
@@ -394,18 +398,20 @@ app.post('/api/queue', (req, res) => {
         }
 
         const queue = readJSON(QUEUE_FILE) || [];
-        const visited = readJSON(VISITED_FILE) || [];
+        const visited = new Set(readJSON(VISITED_FILE) || []);
+        const queuedUrls = new Set(queue.map(item => item.url));
         
         let addedCount = 0;
 
         urls.forEach(url => {
             // Skip if already visited or in queue
-            if (!visited.includes(url) && !queue.some(item => item.url === url)) {
+            if (!visited.has(url) && !queuedUrls.has(url)) {
                 queue.push({
                     url: url,
                     depth: depth || 1,
                     added_at: new Date().toISOString()
                 });
+                queuedUrls.add(url);
                 addedCount++;
             }
         });
@@ -567,24 +573,27 @@ const updateGraph = (profileData) => {
 
         // Add edges for friends
         if (profileData.friends && Array.isArray(profileData.friends)) {
+            // Index existing edge ids once instead of scanning graph.edges per friend
+            const existingEdgeIds = new Set(graph.edges.map(edge => edge.id));
+            
             profileData.friends.forEach(friend => {
                 if (friend.url) {
                     const edgeId = `${profileData.url}-${friend.url}`;
-                    const existingEdge = graph.edges.find(edge => edge.id === edgeId);
                     
-                    if (!existingEdge) {
+                    if (!existingEdgeIds.has(edgeId)) {
                         graph.edges.push({
                             id: edgeId,
                             source: profileData.url,
                             target: friend.url,
                             type: 'friend'
                         });
+                        existingEdgeIds.add(edgeId);
                     }
                 }
             });
         }
 
-        writeJSON(GRAPH_FILE, graph);
+        writeJSON(GRAPH_FILE, graph, 0);
     } catch (error) {
         console.error('Error updating graph:', error);
     }
@@ -802,7 +811,7 @@ app.get('/api/aliases', (req, res) => {
 // POST /api/aliases/detect - Detect similar names automatically
 app.post('/api/aliases/detect', (req, res) => {
     try {
-        const settings = readJSON(SETTINGS_FILE) || { similarityThreshold: 0.7 };
+        const settings = readSettings() || { similarityThreshold: 0.7 };
         const { threshold } = req.body;
         const finalThreshold = threshold || settings.similarityThreshold;
         
@@ -828,6 +837,7 @@ app.post('/api/aliases/detect', (req, res) => {
         
         // Add new similar pairs, avoiding duplicates
         const existingPairs = new Set(aliases.similarNames.map(p => `${p.url1}|${p.url2}`));
+        const similarCountBefore = aliases.similarNames.length;
         
         similarPairs.forEach(pair => {
             const pairKey1 = `${pair.url1}|${pair.url2}`;
@@ -839,7 +849,10 @@ app.post('/api/aliases/detect', (req, res) => {
             }
         });
         
-        writeJSON(ALIASES_FILE, aliases);
+        // Re-running detection usually finds nothing new; skip rewriting the file then
+        if (aliases.similarNames.length !== similarCountBefore) {
+            writeJSON(ALIASES_FILE, aliases, 0);
+        }
         
         res.json({
             success: true,
@@ -882,7 +895,7 @@ app.post('/api/aliases/confirm', (req, res) => {
             !(pair.url1 === url2 && pair.url2 === url1)
         );
         
-        writeJSON(ALIASES_FILE, aliases);
+        writeJSON(ALIASES_FILE, aliases, 0);
         
         res.json({
             success: true,
@@ -914,7 +927,9 @@ app.delete('/api/aliases/similar', (req, res) => {
         
         const removed = beforeCount - aliases.similarNames.length;
         
-        writeJSON(ALIASES_FILE, aliases);
+        if (removed > 0) {
+            writeJSON(ALIASES_FILE, aliases, 0);
+        }
         
         res.json({
             success: true,
@@ -1014,10 +1029,10 @@ app.delete('/api/connections/manual', (req, res) => {
                 ...removedConnection,
                 removedAt: new Date().toISOString()
             });
+            
+            writeJSON(MANUAL_CONNECTIONS_FILE, connections);
         }
         
-        writeJSON(MANUAL_CONNECTIONS_FILE, connections);
-        
         res.json({
             success: true,
             message: `Removed ${removed} manual connection(s)`,
@@ -1034,7 +1049,7 @@ app.delete('/api/connections/manual', (req, res) => {
 // GET /api/settings - Get user settings
 app.get('/api/settings', (req, res) => {
     try {
-        const settings = readJSON(SETTINGS_FILE) || {
+        const settings = readSettings() || {
             similarityThreshold: 0.7,
             autoDetectAliases: true,
             showSimilarNames: true,
@@ -1050,7 +1065,7 @@ app.get('/api/settings', (req, res) => {
 // POST /api/settings - Update user settings
 app.post('/api/settings', (req, res) => {
     try {
-        const currentSettings = readJSON(SETTINGS_FILE) || {};
+        const currentSettings = readSettings() || {};
         const newSettings = { ...currentSettings, ...req.body };
         
         // Validate threshold
@@ -1065,6 +1080,7 @@ app.post('/api/settings', (req, res) => {
         newSettings.lastUpdated = new Date().toISOString();
         
         if (writeJSON(SETTINGS_FILE, newSettings)) {
+            cachedSettings = newSettings;
             res.json({
                 success: true,
                 message: 'Settings updated successfully',
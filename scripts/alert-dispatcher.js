@@ -3,10 +3,25 @@
  * Handles email, SMS, and webhook notifications for danger zone alerts
  */
 
-const nodemailer = require('nodemailer');
 const fs = require('fs').promises;
 const path = require('path');
 
+// Per-severity presentation tables shared by the console and email formatters
+const SEVERITY_EMOJI = Object.freeze({
+    'CRITICAL': '🔴',
+    'HIGH': '🟠',
+    'MEDIUM': '🟡',
+    'LOW': '🟢',
+    'INFO': 'ℹ️'
+});
+const SEVERITY_COLORS = Object.freeze({
+    'CRITICAL': '#dc3545',
+    'HIGH': '#fd7e14',
+    'MEDIUM': '#ffc107',
+    'LOW': '#28a745',
+    'INFO': '#17a2b8'
+});
+
 class AlertDispatcher {
     constructor(config = {}) {
         this.config = {
@@ -45,9 +60,14 @@ class AlertDispatcher {
         this.processingAlert = false;
         this.alertHistory = [];
         this.maxHistorySize = 1000;
+        this.alertsFile = path.join(__dirname, '..', 'backend', 'data', 'dispatched_alerts.jsonl');
+        this.legacyAlertsFile = path.join(__dirname, '..', 'backend', 'data', 'dispatched_alerts.json');
+        this.maxSavedAlerts = 500;
+        this.savedAlertLines = null; // Lines in alertsFile, counted on the first save
 
-        // Initialize email transporter if enabled
+        // Initialize email transporter if enabled (nodemailer is only loaded when needed)
         if (this.config.email.enabled) {
+            const nodemailer = require('nodemailer');
             this.emailTransporter = nodemailer.createTransporter(this.config.email.smtp);
         }
     }
@@ -99,7 +119,8 @@ class AlertDispatcher {
                 // Add to history
                 this.alertHistory.unshift(alert);
                 if (this.alertHistory.length > this.maxHistorySize) {
-                    this.alertHistory = this.alertHistory.slice(0, this.maxHistorySize);
+                    // Trim in place rather than copying the whole history on every alert
+                    this.alertHistory.length = this.maxHistorySize;
                 }
             }
         } finally {
@@ -223,52 +244,42 @@ class AlertDispatcher {
      * Log alert to console with formatting
      */
     logToConsole(alert) {
-        const severityEmojis = {
-            'CRITICAL': '🔴',
-            'HIGH': '🟠',
-            'MEDIUM': '🟡',
-            'LOW': '🟢',
-            'INFO': 'ℹ️'
-        };
-
-        const emoji = severityEmojis[alert.severity] || '⚠️';
-        
-        console.log('\n' + '='.repeat(60));
-        console.log(`${emoji} ${alert.severity} SAFETY ALERT ${emoji}`);
-        console.log('='.repeat(60));
-        console.log(`📋 Title: ${alert.title}`);
-        console.log(`⏰ Time: ${alert.timestamp}`);
-        console.log(`📝 Description: ${alert.description}`);
+        const emoji = SEVERITY_EMOJI[alert.severity] || '⚠️';
+        const divider = '='.repeat(60);
+
+        // Build the whole block first so it is written in one call and never interleaves
+        const lines = [
+            '\n' + divider,
+            `${emoji} ${alert.severity} SAFETY ALERT ${emoji}`,
+            divider,
+            `📋 Title: ${alert.title}`,
+            `⏰ Time: ${alert.timestamp}`,
+            `📝 Description: ${alert.description}`
+        ];
         
         if (alert.details && Object.keys(alert.details).length > 0) {
-            console.log('📊 Details:');
+            lines.push('📊 Details:');
             Object.entries(alert.details).forEach(([key, value]) => {
-                console.log(`   • ${key}: ${value}`);
+                lines.push(`   • ${key}: ${value}`);
             });
         }
 
         if (alert.recommendations && alert.recommendations.length > 0) {
-            console.log('💡 Recommendations:');
+            lines.push('💡 Recommendations:');
             alert.recommendations.forEach((rec, index) => {
-                console.log(`   ${index + 1}. ${rec}`);
+                lines.push(`   ${index + 1}. ${rec}`);
             });
         }
-        console.log('='.repeat(60) + '\n');
+        lines.push(divider + '\n');
+
+        console.log(lines.join('\n'));
     }
 
     /**
      * Generate HTML email content
      */
     generateEmailHTML(alert) {
-        const severityColors = {
-            'CRITICAL': '#dc3545',
-            'HIGH': '#fd7e14',
-            'MEDIUM': '#ffc107',
-            'LOW': '#28a745',
-            'INFO': '#17a2b8'
-        };
-
-        const color = severityColors[alert.severity] || '#6c757d';
+        const color = SEVERITY_COLORS[alert.severity] || '#6c757d';
 
         return `
         <!DOCTYPE html>
@@ -354,34 +365,69 @@ class AlertDispatcher {
     }
 
     /**
-     * Save alert to file
+     * Append alert to the dispatched alerts log (one JSON object per line, oldest first)
      */
     async saveAlertToFile(alert) {
         try {
-            const alertsDir = path.join(__dirname, '..', 'backend', 'data');
-            const alertsFile = path.join(alertsDir, 'dispatched_alerts.json');
-
-            let existingAlerts = [];
-            try {
-                const data = await fs.readFile(alertsFile, 'utf8');
-                existingAlerts = JSON.parse(data);
-            } catch (error) {
-                // File doesn't exist or is empty, start with empty array
+            if (this.savedAlertLines === null) {
+                this.savedAlertLines = await this.loadAlertLog();
             }
 
-            existingAlerts.unshift(alert);
-            
-            // Keep only the last 500 alerts
-            if (existingAlerts.length > 500) {
-                existingAlerts = existingAlerts.slice(0, 500);
-            }
+            await fs.appendFile(this.alertsFile, JSON.stringify(alert) + '\n');
 
-            await fs.writeFile(alertsFile, JSON.stringify(existingAlerts, null, 2));
+            // Let the log grow to twice the cap between rewrites so trimming stays off the per-alert path
+            if (++this.savedAlertLines >= this.maxSavedAlerts * 2) {
+                await this.compactAlertLog();
+            }
         } catch (error) {
             console.error('❌ Failed to save alert to file:', error.message);
         }
     }
 
+    /**
+     * Count saved alerts, first folding in the old dispatched_alerts.json array if it is still around
+     */
+    async loadAlertLog() {
+        let log = '';
+        try {
+            log = await fs.readFile(this.alertsFile, 'utf8');
+        } catch (error) {
+            if (error.code !== 'ENOENT') throw error;
+        }
+
+        try {
+            // A non-empty log means an earlier migration already wrote these alerts and only the unlink is left
+            if (!log) {
+                const legacyAlerts = JSON.parse(await fs.readFile(this.legacyAlertsFile, 'utf8'));
+                // The old file is newest-first; the log is oldest-first
+                const migrated = legacyAlerts.slice(0, this.maxSavedAlerts).reverse();
+                log = migrated.map(alert => JSON.stringify(alert) + '\n').join('');
+                await fs.writeFile(this.alertsFile, log);
+                console.log(`📦 Migrated ${migrated.length} alerts from dispatched_alerts.json`);
+            }
+            await fs.unlink(this.legacyAlertsFile);
+        } catch (error) {
+            if (error.code !== 'ENOENT') {
+                console.error('❌ Failed to migrate dispatched_alerts.json:', error.message);
+            }
+        }
+
+        return log.split('\n').filter(Boolean).length;
+    }
+
+    /**
+     * Trim the dispatched alerts log to the newest maxSavedAlerts entries
+     */
+    async compactAlertLog() {
+        const lines = (await fs.readFile(this.alertsFile, 'utf8')).split('\n').filter(Boolean);
+        const kept = lines.slice(-this.maxSavedAlerts);
+        const tempFile = `${this.alertsFile}.tmp`;
+
+        await fs.writeFile(tempFile, kept.join('\n') + '\n');
+        await fs.rename(tempFile, this.alertsFile);
+        this.savedAlertLines = kept.length;
+    }
+
     /**
      * Generate unique alert ID
      */
@@ -393,9 +439,9 @@ class AlertDispatcher {
      * Get alert statistics
      */
     getAlertStats() {
-        const last24h = new Date(Date.now() - 24 * 60 * 60 * 1000);
+        const last24h = Date.now() - 24 * 60 * 60 * 1000;
         const recent = this.alertHistory.filter(alert => 
-            new Date(alert.timestamp) > last24h
+            Date.parse(alert.timestamp) > last24h
         );
 
         const severityCounts = recent.reduce((acc, alert) => {
@@ -420,6 +466,7 @@ class AlertDispatcher {
         
         // Reinitialize email transporter if email config changed
         if (newConfig.email && this.config.email.enabled) {
+            const nodemailer = require('nodemailer');
             this.emailTransporter = nodemailer.createTransporter(this.config.email.smtp);
         }
     }
@@ -5,6 +5,14 @@ const path = require('path');
 const DATA_DIR = path.join(__dirname, '..', 'backend', 'data');
 const GRAPH_FILE = path.join(DATA_DIR, 'graph.json');
 
+// CLI usage text, printed with a single write
+const USAGE = [
+    'Usage:',
+    '  node analyze-communities.js analyze    - Analyze communities',
+    '  node analyze-communities.js export [format]  - Export results',
+    '  node analyze-communities.js report     - Show analysis summary'
+].join('\n');
+
 // Community detection algorithms
 class CommunityAnalyzer {
     constructor(graph) {
@@ -12,6 +20,7 @@ class CommunityAnalyzer {
         this.nodes = graph.nodes;
         this.edges = graph.edges;
         this.adjList = this.buildAdjacencyList();
+        this.nodeById = this.buildNodeIndex();
     }
 
     buildAdjacencyList() {
@@ -26,6 +35,15 @@ class CommunityAnalyzer {
         return adjList;
     }
 
+    // Id -> node lookup built once, instead of scanning this.nodes on every neighbour visit
+    buildNodeIndex() {
+        const nodeById = new Map();
+        this.nodes.forEach(node => {
+            if (!nodeById.has(node.id)) nodeById.set(node.id, node);
+        });
+        return nodeById;
+    }
+
     // Louvain algorithm for community detection (simplified)
     detectCommunities() {
         console.log('🔍 Detecting communities using Louvain algorithm...');
@@ -175,17 +193,18 @@ class CommunityAnalyzer {
         
         const stats = communities.map(comm => {
             const members = comm.members.map(nodeId => 
-                this.nodes.find(n => n.id === nodeId)
+                this.nodeById.get(nodeId)
             ).filter(n => n);
 
             // Internal edges
+            const memberIds = new Set(comm.members);
             let internalEdges = 0;
             let externalEdges = 0;
 
             members.forEach(node => {
                 const neighbors = this.adjList.get(node.id) || [];
                 neighbors.forEach(neighbor => {
-                    if (comm.members.includes(neighbor)) {
+                    if (memberIds.has(neighbor)) {
                         internalEdges++;
                     } else {
                         externalEdges++;
@@ -236,7 +255,7 @@ class CommunityAnalyzer {
 
         communities.forEach(comm => {
             const members = comm.members.map(nodeId => 
-                this.nodes.find(n => n.id === nodeId)
+                this.nodeById.get(nodeId)
             ).filter(n => n);
 
             // Sort by combined influence score
@@ -552,10 +571,7 @@ if (require.main === module) {
             }
             break;
         default:
-            console.log('Usage:');
-            console.log('  node analyze-communities.js analyze    - Analyze communities');
-            console.log('  node analyze-communities.js export [format]  - Export results');
-            console.log('  node analyze-communities.js report     - Show analysis summary');
+            console.log(USAGE);
     }
 }
 
@@ -6,6 +6,14 @@ const DATA_DIR = path.join(__dirname, '..', 'backend', 'data');
 const PROFILES_DIR = path.join(DATA_DIR, 'profiles');
 const GRAPH_FILE = path.join(DATA_DIR, 'graph.json');
 
+// CLI usage text, printed with a single write
+const USAGE = [
+    'Usage:',
+    '  node build-graph.js build    - Build graph from profiles',
+    '  node build-graph.js export [format]  - Export graph (json/csv/gexf)',
+    '  node build-graph.js stats    - Show graph statistics'
+].join('\n');
+
 // Helper functions
 const readJSON = (filePath) => {
     try {
@@ -16,9 +24,10 @@ const readJSON = (filePath) => {
     }
 };
 
-const writeJSON = (filePath, data) => {
+// graph.json is only machine-read, so it is written with indent 0 to skip pretty-printing
+const writeJSON = (filePath, data, indent = 2) => {
     try {
-        fs.writeFileSync(filePath, JSON.stringify(data, null, 2));
+        fs.writeFileSync(filePath, JSON.stringify(data, null, indent));
         return true;
     } catch (error) {
         console.error(`Error writing ${filePath}:`, error);
@@ -153,7 +162,7 @@ function buildGraph() {
     findConnectedComponents(graph);
 
     // Save graph
-    if (writeJSON(GRAPH_FILE, graph)) {
+    if (writeJSON(GRAPH_FILE, graph, 0)) {
         console.log(`✅ Graph saved to ${GRAPH_FILE}`);
         printGraphStats(graph);
         return graph;
@@ -336,6 +345,21 @@ function dfsComponent(nodeId, adjList, visited, component) {
     });
 }
 
+// Pick the n highest-scoring items in one pass without sorting (or reordering) the whole array
+function topN(items, n, score) {
+    const top = [];
+    for (const item of items) {
+        if (top.length === n && score(item) <= score(top[n - 1])) continue;
+        let i = top.length < n ? top.length : n - 1;
+        while (i > 0 && score(top[i - 1]) < score(item)) {
+            top[i] = top[i - 1];
+            i--;
+        }
+        top[i] = item;
+    }
+    return top;
+}
+
 function printGraphStats(graph) {
     console.log('\n📈 GRAPH STATISTICS');
     console.log('==================');
@@ -351,13 +375,13 @@ function printGraphStats(graph) {
     });
     
     // Top nodes by metrics
-    const topByDegree = graph.nodes.sort((a, b) => b.degree - a.degree).slice(0, 5);
+    const topByDegree = topN(graph.nodes, 5, node => node.degree);
     console.log('\nTop 5 nodes by degree:');
     topByDegree.forEach((node, i) => {
         console.log(`  ${i + 1}. ${node.name} (${node.degree} connections)`);
     });
     
-    const topByPageRank = graph.nodes.sort((a, b) => b.pagerank - a.pagerank).slice(0, 5);
+    const topByPageRank = topN(graph.nodes, 5, node => node.pagerank);
     console.log('\nTop 5 nodes by PageRank:');
     topByPageRank.forEach((node, i) => {
         console.log(`  ${i + 1}. ${node.name} (${node.pagerank.toFixed(4)})`);
@@ -468,10 +492,7 @@ if (require.main === module) {
             if (graph) printGraphStats(graph);
             break;
         default:
-            console.log('Usage:');
-            console.log('  node build-graph.js build    - Build graph from profiles');
-            console.log('  node build-graph.js export [format]  - Export graph (json/csv/gexf)');
-            console.log('  node build-graph.js stats    - Show graph statistics');
+            console.log(USAGE);
     }
 }
 
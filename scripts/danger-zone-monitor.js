@@ -5,12 +5,29 @@ const { KidSafetyAnalyzer } = require('./kid-safety-analyzer.js');
 const fs = require('fs');
 const path = require('path');
 
+// CLI usage text, printed with a single write
+const USAGE = [
+    'Usage:',
+    '  node danger-zone-monitor.js --start   # Start continuous monitoring',
+    '  node danger-zone-monitor.js --check   # Run single check',
+    '  node danger-zone-monitor.js --status  # Show status'
+].join('\n');
+
+// Write JSON via a temp file + rename so a crash mid-write never leaves a truncated state file
+const writeJSON = (filePath, data) => {
+    const tmpPath = `${filePath}.tmp`;
+    fs.writeFileSync(tmpPath, JSON.stringify(data, null, 2));
+    fs.renameSync(tmpPath, filePath);
+};
+
 class DangerZoneMonitor {
     constructor(dataDir = path.join(__dirname, '../backend/data')) {
         this.dataDir = dataDir;
         this.historyFile = path.join(dataDir, 'danger_zone_history.json');
         this.alertsFile = path.join(dataDir, 'danger_alerts.json');
         this.configFile = path.join(dataDir, 'monitor_config.json');
+        this.graphFile = path.join(dataDir, 'graph.json');
+        this.annotationsFile = path.join(dataDir, 'annotations.json');
         
         this.config = this.loadConfig();
         this.history = this.loadHistory();
@@ -28,11 +45,10 @@ class DangerZoneMonitor {
     // Load monitoring configuration
     loadConfig() {
         try {
-            if (fs.existsSync(this.configFile)) {
-                return JSON.parse(fs.readFileSync(this.configFile, 'utf8'));
-            }
+            return JSON.parse(fs.readFileSync(this.configFile, 'utf8'));
         } catch (error) {
-            console.log('Using default monitoring config');
+            // A missing file is the normal first run; only report unreadable ones
+            if (error.code !== 'ENOENT') console.log('Using default monitoring config');
         }
         
         return {
@@ -47,11 +63,9 @@ class DangerZoneMonitor {
     // Load danger zone history
     loadHistory() {
         try {
-            if (fs.existsSync(this.historyFile)) {
-                return JSON.parse(fs.readFileSync(this.historyFile, 'utf8'));
-            }
+            return JSON.parse(fs.readFileSync(this.historyFile, 'utf8'));
         } catch (error) {
-            console.log('No danger zone history found, starting fresh');
+            if (error.code !== 'ENOENT') console.log(`Could not read ${this.historyFile} (${error.message}), starting fresh`);
         }
         return [];
     }
@@ -59,26 +73,24 @@ class DangerZoneMonitor {
     // Load alerts history
     loadAlerts() {
         try {
-            if (fs.existsSync(this.alertsFile)) {
-                return JSON.parse(fs.readFileSync(this.alertsFile, 'utf8'));
-            }
+            return JSON.parse(fs.readFileSync(this.alertsFile, 'utf8'));
         } catch (error) {
-            console.log('No alerts history found, starting fresh');
+            if (error.code !== 'ENOENT') console.log(`Could not read ${this.alertsFile} (${error.message}), starting fresh`);
         }
         return [];
     }
 
     // Save data to files
     saveHistory() {
-        fs.writeFileSync(this.historyFile, JSON.stringify(this.history, null, 2));
+        writeJSON(this.historyFile, this.history);
     }
 
     saveAlerts() {
-        fs.writeFileSync(this.alertsFile, JSON.stringify(this.alerts, null, 2));
+        writeJSON(this.alertsFile, this.alerts);
     }
 
     saveConfig() {
-        fs.writeFileSync(this.configFile, JSON.stringify(this.config, null, 2));
+        writeJSON(this.configFile, this.config);
     }
 
     // Run a monitoring check
@@ -87,15 +99,12 @@ class DangerZoneMonitor {
         
         try {
             // Load current network data
-            const graphPath = path.join(this.dataDir, 'graph.json');
-            const annotationsPath = path.join(this.dataDir, 'annotations.json');
-            
-            if (!fs.existsSync(graphPath) || !fs.existsSync(annotationsPath)) {
+            if (!fs.existsSync(this.graphFile) || !fs.existsSync(this.annotationsFile)) {
                 throw new Error('Network data files not found');
             }
 
-            const graph = JSON.parse(fs.readFileSync(graphPath, 'utf8'));
-            const annotations = JSON.parse(fs.readFileSync(annotationsPath, 'utf8'));
+            const graph = JSON.parse(fs.readFileSync(this.graphFile, 'utf8'));
+            const annotations = JSON.parse(fs.readFileSync(this.annotationsFile, 'utf8'));
 
             // Run safety analysis
             const analyzer = new KidSafetyAnalyzer(graph, annotations);
@@ -125,9 +134,9 @@ class DangerZoneMonitor {
                 this.processAlerts(newAlerts);
             }
 
-            // Save data
+            // Save data (the alerts file only changes when new alerts were added)
             this.saveHistory();
-            this.saveAlerts();
+            if (newAlerts.length > 0) this.saveAlerts();
 
             // Generate monitoring report
             const report = this.generateMonitoringReport(snapshot, newAlerts);
@@ -204,9 +213,9 @@ class DangerZoneMonitor {
         });
 
         // 3. Check for new danger sources
-        const previousSources = previousSnapshot.danger_sources.map(s => s.nodeId);
+        const previousSources = new Set(previousSnapshot.danger_sources.map(s => s.nodeId));
         const currentSources = currentSnapshot.danger_sources.map(s => s.nodeId);
-        const newSources = currentSources.filter(id => !previousSources.includes(id));
+        const newSources = currentSources.filter(id => !previousSources.has(id));
 
         newSources.forEach(sourceId => {
             const source = currentSnapshot.danger_sources.find(s => s.nodeId === sourceId);
@@ -293,7 +302,7 @@ class DangerZoneMonitor {
 
         // Save report
         const reportPath = path.join(this.dataDir, 'danger_monitoring_report.json');
-        fs.writeFileSync(reportPath, JSON.stringify(report, null, 2));
+        writeJSON(reportPath, report);
 
         return report;
     }
@@ -372,7 +381,7 @@ class DangerZoneMonitor {
         };
 
         const alertReportPath = path.join(this.dataDir, 'latest_alerts.json');
-        fs.writeFileSync(alertReportPath, JSON.stringify(alertReport, null, 2));
+        writeJSON(alertReportPath, alertReport);
 
         console.log('📄 Alert report saved to latest_alerts.json');
     }
@@ -381,9 +390,10 @@ class DangerZoneMonitor {
     cleanOldHistory() {
         const cutoffDate = new Date();
         cutoffDate.setDate(cutoffDate.getDate() - this.config.keep_history_days);
+        const cutoff = cutoffDate.getTime();
 
         this.history = this.history.filter(entry => 
-            new Date(entry.timestamp) >= cutoffDate
+            Date.parse(entry.timestamp) >= cutoff
         );
     }
 
@@ -414,12 +424,10 @@ class DangerZoneMonitor {
     // Get monitoring status
     getStatus() {
         const lastCheck = this.history.length > 0 ? this.history[this.history.length - 1] : null;
-        const recentAlerts = this.alerts.filter(a => {
-            const alertTime = new Date(a.timestamp);
-            const dayAgo = new Date();
-            dayAgo.setDate(dayAgo.getDate() - 1);
-            return alertTime >= dayAgo;
-        });
+        const dayAgo = new Date();
+        dayAgo.setDate(dayAgo.getDate() - 1);
+        const cutoff = dayAgo.getTime();
+        const recentAlerts = this.alerts.filter(a => Date.parse(a.timestamp) >= cutoff);
 
         return {
             monitoring_enabled: this.config.monitoring_enabled,
@@ -433,15 +441,12 @@ class DangerZoneMonitor {
     async getSummaryReport() {
         try {
             // Load current network data and create snapshot
-            const graphPath = path.join(this.dataDir, 'graph.json');
-            const annotationsPath = path.join(this.dataDir, 'annotations.json');
-            
-            if (!fs.existsSync(graphPath) || !fs.existsSync(annotationsPath)) {
+            if (!fs.existsSync(this.graphFile) || !fs.existsSync(this.annotationsFile)) {
                 throw new Error('Network data files not found');
             }
 
-            const graph = JSON.parse(fs.readFileSync(graphPath, 'utf8'));
-            const annotations = JSON.parse(fs.readFileSync(annotationsPath, 'utf8'));
+            const graph = JSON.parse(fs.readFileSync(this.graphFile, 'utf8'));
+            const annotations = JSON.parse(fs.readFileSync(this.annotationsFile, 'utf8'));
 
             // Run safety analysis
             const analyzer = new KidSafetyAnalyzer(graph, annotations);
@@ -515,21 +520,19 @@ module.exports = { DangerZoneMonitor };
 
 // CLI usage
 if (require.main === module) {
-    const monitor = new DangerZoneMonitor();
-    
+    // The monitor loads config, history and alerts on construction, so only
+    // build it once a known flag has been matched
     if (process.argv.includes('--start')) {
-        monitor.startMonitoring();
+        new DangerZoneMonitor().startMonitoring();
     } else if (process.argv.includes('--check')) {
-        monitor.checkNow().then(result => {
+        new DangerZoneMonitor().checkNow().then(result => {
             console.log('Check completed:', result);
             process.exit(0);
         });
     } else if (process.argv.includes('--status')) {
-        console.log('Monitoring Status:', monitor.getStatus());
-    } else {        console.log('Usage:');
-        console.log('  node danger-zone-monitor.js --start   # Start continuous monitoring');
-        console.log('  node danger-zone-monitor.js --check   # Run single check');
-        console.log('  node danger-zone-monitor.js --status  # Show status');
+        console.log('Monitoring Status:', new DangerZoneMonitor().getStatus());
+    } else {
+        console.log(USAGE);
     }
 }
 
@@ -8,6 +8,10 @@ const AlertDispatcher = require('./alert-dispatcher');
 const path = require('path');
 const fs = require('fs').promises;
 
+// Log level tables shared by every IntegratedSafetyMonitor.log() call
+const LOG_LEVELS = { debug: 0, info: 1, warn: 2, error: 3 };
+const LOG_EMOJI = { debug: '🔍', info: 'ℹ️', warn: '⚠️', error: '❌' };
+
 class IntegratedSafetyMonitor {
     constructor(config = {}) {
         this.config = {
@@ -37,6 +41,7 @@ class IntegratedSafetyMonitor {
 
         this.monitor = new DangerZoneMonitor();
         this.dispatcher = new AlertDispatcher(this.config.alerting);
+        this.logThreshold = this.resolveLogThreshold();
         
         this.isRunning = false;
         this.monitoringInterval = null;
@@ -322,6 +327,7 @@ class IntegratedSafetyMonitor {
      */
     updateConfig(newConfig) {
         this.config = { ...this.config, ...newConfig };
+        this.logThreshold = this.resolveLogThreshold();
         
         // Update dispatcher config
         if (newConfig.alerting) {
@@ -369,18 +375,22 @@ class IntegratedSafetyMonitor {
         }
     }
 
+    /**
+     * Resolve the configured log level name to its numeric threshold
+     */
+    resolveLogThreshold() {
+        return LOG_LEVELS[this.config.logging.level] || 1;
+    }
+
     /**
      * Logging utility
      */
     log(level, message, ...args) {
         if (!this.config.logging.enabled) return;
         
-        const levels = { debug: 0, info: 1, warn: 2, error: 3 };
-        const configLevel = levels[this.config.logging.level] || 1;
-        
-        if (levels[level] >= configLevel) {
+        if (LOG_LEVELS[level] >= this.logThreshold) {
             const timestamp = new Date().toISOString();
-            const emoji = { debug: '🔍', info: 'ℹ️', warn: '⚠️', error: '❌' }[level] || '';
+            const emoji = LOG_EMOJI[level] || '';
             console.log(`${timestamp} ${emoji} [${level.toUpperCase()}] ${message}`, ...args);
         }
     }
@@ -393,7 +403,8 @@ if (require.main === module) {
     const args = process.argv.slice(2);
     const command = args[0];
 
-    const monitor = new IntegratedSafetyMonitor({
+    // Only build the monitor (and its analyzer/dispatcher) for real commands
+    const createMonitor = () => new IntegratedSafetyMonitor({
         monitoring: {
             interval: 30000, // 30 seconds for demo
             enabled: true
@@ -414,7 +425,8 @@ if (require.main === module) {
     async function handleCommand() {
         try {
             switch (command) {
-                case 'start':
+                case 'start': {
+                    const monitor = createMonitor();
                     await monitor.start();
                     console.log('✅ Monitoring started. Press Ctrl+C to stop.');
                     
@@ -425,20 +437,21 @@ if (require.main === module) {
                         process.exit(0);
                     });
                     break;
+                }
 
                 case 'check':
                     console.log('🔍 Running single monitoring check...');
-                    const result = await monitor.runSingleCheck();
+                    const result = await createMonitor().runSingleCheck();
                     console.log('✅ Check completed:', result.summary);
                     break;
 
                 case 'status':
-                    const status = monitor.getStatus();
+                    const status = createMonitor().getStatus();
                     console.log('📊 System Status:', JSON.stringify(status, null, 2));
                     break;
 
                 case 'report':
-                    const report = await monitor.getReport();
+                    const report = await createMonitor().getReport();
                     console.log('📋 Full Report:', JSON.stringify(report, null, 2));
                     break;
 
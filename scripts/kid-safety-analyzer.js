@@ -7,6 +7,14 @@ const DATA_DIR = path.join(__dirname, '..', 'backend', 'data');
 const GRAPH_FILE = path.join(DATA_DIR, 'graph.json');
 const ANNOTATIONS_FILE = path.join(DATA_DIR, 'annotations.json');
 
+// Common alias name patterns (compiled once, checked for every node)
+const ALIAS_NAME_PATTERNS = [
+    /^\w+\s+\w+\s+\d{4}$/,           // FirstName LastName YYYY
+    /^\w{3,}\s+[a-z]{1,3}$/,        // Word + short word
+    /^[a-z]+\d+$/,                   // letters + numbers
+    /^\w+\s+\w+\s+(jr|sr|ii|iii)$/i // Jr/Sr suffixes
+];
+
 class KidSafetyAnalyzer {
     constructor(graph, annotations) {
         this.graph = graph;
@@ -14,6 +22,7 @@ class KidSafetyAnalyzer {
         this.nodes = graph.nodes;
         this.edges = graph.edges;
         this.adjList = this.buildAdjacencyList();
+        this.nodeById = this.buildNodeIndex();
         
         // Safety thresholds
         this.DANGER_THRESHOLDS = {
@@ -47,6 +56,15 @@ class KidSafetyAnalyzer {
         return adjList;
     }
 
+    // Id -> node lookup built once, instead of scanning this.nodes on every neighbour visit
+    buildNodeIndex() {
+        const nodeById = new Map();
+        this.nodes.forEach(node => {
+            if (!nodeById.has(node.id)) nodeById.set(node.id, node);
+        });
+        return nodeById;
+    }
+
     // Main analysis function
     analyzeSafetyRisks() {
         console.log('🚨 Starting Kid Safety Analysis...');
@@ -142,15 +160,7 @@ class KidSafetyAnalyzer {
         // Simple heuristics for alias detection
         const name = node.name?.toLowerCase() || '';
         
-        // Common alias patterns
-        const aliasPatterns = [
-            /^\w+\s+\w+\s+\d{4}$/,           // FirstName LastName YYYY
-            /^\w{3,}\s+[a-z]{1,3}$/,        // Word + short word
-            /^[a-z]+\d+$/,                   // letters + numbers
-            /^\w+\s+\w+\s+(jr|sr|ii|iii)$/i // Jr/Sr suffixes
-        ];
-
-        return aliasPatterns.some(pattern => pattern.test(name)) ||
+        return ALIAS_NAME_PATTERNS.some(pattern => pattern.test(name)) ||
                name.includes('fake') || name.includes('alias') ||
                node.profile_image === null || node.profile_image === '';
     }
@@ -168,7 +178,7 @@ class KidSafetyAnalyzer {
             let adultConnections = 0;
 
             connections.forEach(connectionId => {
-                const connectedNode = this.nodes.find(n => n.id === connectionId);
+                const connectedNode = this.nodeById.get(connectionId);
                 if (!connectedNode) return;
 
                 const annotation = this.annotations[connectedNode.url];
@@ -219,7 +229,7 @@ class KidSafetyAnalyzer {
             const connectedAdults = [];
 
             connections.forEach(connectionId => {
-                const connectedNode = this.nodes.find(n => n.id === connectionId);
+                const connectedNode = this.nodeById.get(connectionId);
                 if (!connectedNode) return;
 
                 const annotation = this.annotations[connectedNode.url];
@@ -298,7 +308,7 @@ class KidSafetyAnalyzer {
 
         // Analyze direct connections
         directConnections.forEach(connectionId => {
-            const connectedNode = this.nodes.find(n => n.id === connectionId);
+            const connectedNode = this.nodeById.get(connectionId);
             if (!connectedNode) return;
 
             const annotation = this.annotations[connectedNode.url];
@@ -322,7 +332,7 @@ class KidSafetyAnalyzer {
         network.directConnections.adults.forEach(adult => {
             const adultConnections = this.adjList.get(adult.id) || [];
             adultConnections.forEach(connectionId => {
-                const connectedNode = this.nodes.find(n => n.id === connectionId);
+                const connectedNode = this.nodeById.get(connectionId);
                 if (connectedNode && this.annotations[connectedNode.url]?.demographic === 'kids') {
                     network.secondDegreeKids.push({
                         kid: connectedNode,
@@ -349,7 +359,7 @@ class KidSafetyAnalyzer {
             let adultConnections = 0;
 
             connections.forEach(connectionId => {
-                const connectedNode = this.nodes.find(n => n.id === connectionId);
+                const connectedNode = this.nodeById.get(connectionId);
                 if (!connectedNode) return;
 
                 const annotation = this.annotations[connectedNode.url];
@@ -419,7 +429,7 @@ class KidSafetyAnalyzer {
         const connections = this.adjList.get(startNode.id) || [];
         
         connections.forEach(connectionId => {
-            const connectedNode = this.nodes.find(n => n.id === connectionId);
+            const connectedNode = this.nodeById.get(connectionId);
             if (!connectedNode || visited.has(connectedNode.id)) return;
 
             const annotation = this.annotations[connectedNode.url];
@@ -735,13 +745,13 @@ class KidSafetyAnalyzer {
 
     // Helper methods
     getConnectedKids(nodeId, kids) {
-        const connections = this.adjList.get(nodeId) || [];
-        return kids.filter(kid => connections.includes(kid.id));
+        const connections = new Set(this.adjList.get(nodeId) || []);
+        return kids.filter(kid => connections.has(kid.id));
     }
 
     getConnectedAdults(nodeId, adults) {
-        const connections = this.adjList.get(nodeId) || [];
-        return adults.filter(adult => connections.includes(adult.id));
+        const connections = new Set(this.adjList.get(nodeId) || []);
+        return adults.filter(adult => connections.has(adult.id));
     }
 
     getConvictedProximity(nodeId, convicted) {
@@ -1025,7 +1035,7 @@ class KidSafetyAnalyzer {
         const connections = this.adjList.get(kid.id) || [];
         
         connections.forEach(connectionId => {
-            const connectedNode = this.nodes.find(n => n.id === connectionId);
+            const connectedNode = this.nodeById.get(connectionId);
             if (!connectedNode) return;
             
             // Check if this connection leads away from danger
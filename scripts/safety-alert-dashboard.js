@@ -14,6 +14,7 @@ class SafetyAlertDashboard {
         this.monitor = new DangerZoneMonitor();
         this.isMonitoringActive = false;
         this.monitoringInterval = null;
+        this.dashboardHTML = null;
         
         this.setupMiddleware();
         this.setupRoutes();
@@ -29,7 +30,9 @@ class SafetyAlertDashboard {
     setupRoutes() {
         // Dashboard home page
         this.app.get('/dashboard', (req, res) => {
-            res.send(this.generateDashboardHTML());
+            // The page is static (live data comes from the API), so build it once
+            if (!this.dashboardHTML) this.dashboardHTML = this.generateDashboardHTML();
+            res.send(this.dashboardHTML);
         });
 
         // API Routes
@@ -188,9 +191,10 @@ class SafetyAlertDashboard {
     getRecentAlerts(hours = 24) {
         const cutoffTime = new Date();
         cutoffTime.setHours(cutoffTime.getHours() - hours);
+        const cutoff = cutoffTime.getTime();
         
         return this.monitor.alerts.filter(alert => 
-            new Date(alert.timestamp) >= cutoffTime
+            Date.parse(alert.timestamp) >= cutoff
         );
     }
 
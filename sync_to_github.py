@@ -7,17 +7,7 @@ from datetime import datetime
 from time import sleep
 import platform
 import io
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-# Set up logging
-console_handler = logging.StreamHandler(sys.stdout)
-file_handler = logging.FileHandler("sync_log.txt", mode='a', encoding='utf-8')
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[console_handler, file_handler]
-)
 logger = logging.getLogger("github_sync")
 
 # CONFIG
@@ -65,12 +55,28 @@ ASSETS = [
     "scripts/",
 ]
 
+# Directories that must exist (an empty .gitkeep is added so git tracks them)
+REQUIRED_DIRECTORIES = ("modules", "assets", "examples", "docs")
+
 GIT_CONFIG = {
     "core.autocrlf": "true",       # Handle line endings automatically
     "diff.renameLimit": "10000",   # Increase rename detection limit
     "diff.renames": "true"         # Ensure rename detection is enabled
 }
 
+def setup_logging():
+    """Route log output to a UTF-8 console stream and the sync log file."""
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.FileHandler("sync_log.txt", mode='a', encoding='utf-8')
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[console_handler, file_handler]
+    )
+
 class GitSyncException(Exception):
     """Custom exception for Git sync errors"""
     pass
@@ -78,7 +84,7 @@ class GitSyncException(Exception):
 def run_command(command, cwd, check_error=True, silent=False):
     """Run a shell command and return result with improved error handling"""
     if not silent:
-        logger.info(f"Running: {command}")
+        logger.info("Running: %s", command)
         
     try:
         result = subprocess.run(
@@ -98,18 +104,18 @@ def run_command(command, cwd, check_error=True, silent=False):
         if result.stderr:
             # Don't treat warnings as errors
             if ("error:" in result.stderr.lower() and "warning:" not in result.stderr.lower()) or result.returncode != 0:
-                logger.error(f"❌ {result.stderr.strip()}")
+                logger.error("❌ %s", result.stderr.strip())
                 if check_error:
                     raise GitSyncException(result.stderr.strip())
             elif "warning:" in result.stderr.lower():
-                logger.warning(f"⚠️ {result.stderr.strip()}")
+                logger.warning("⚠️ %s", result.stderr.strip())
             elif not silent:
                 logger.info(result.stderr.strip())
                 
         return result
     except Exception as e:
-        logger.error(f"Command failed: {command}")
-        logger.error(f"Error: {str(e)}")
+        logger.error("Command failed: %s", command)
+        logger.error("Error: %s", e)
         if check_error:
             raise GitSyncException(f"Command failed: {str(e)}")
         return None
@@ -140,11 +146,10 @@ def apply_git_configs():
 def ensure_directories_exist():
     """Ensure all required directories exist."""
     logger.info("📁 Checking required directories")
-    directories = ["modules", "assets", "examples", "docs"]
-    for directory in directories:
+    for directory in REQUIRED_DIRECTORIES:
         dir_path = os.path.join(REPO_PATH, directory)
         if not os.path.exists(dir_path):
-            logger.info(f"Creating directory: {directory}")
+            logger.info("Creating directory: %s", directory)
             os.makedirs(dir_path)
             
             # Create a .gitkeep file to ensure empty directories are tracked
@@ -152,7 +157,7 @@ def ensure_directories_exist():
             if not os.path.exists(gitkeep_path):
                 with open(gitkeep_path, "w") as f:
                     f.write("# This file ensures the directory is tracked by git\n")
-                logger.info(f"Created .gitkeep in {directory}")
+                logger.info("Created .gitkeep in %s", directory)
 
 def create_gitignore():
     """Create .gitignore file if it doesn't exist."""
@@ -238,54 +243,51 @@ def ensure_files_tracked():
     logger.info("📎 Checking that all files are tracked")
     # Get list of tracked files
     result = run_command("git ls-files", REPO_PATH, silent=True)
-    tracked_files = result.stdout.strip().split("\n") if result and result.returncode == 0 else []
+    tracked_files = set(result.stdout.strip().split("\n")) if result and result.returncode == 0 else set()
+    
+    # Core/optional files and asset directories all live at the repo root, so a
+    # single scandir answers every existence check below without a stat per name
+    with os.scandir(REPO_PATH) as entries:
+        root_entries = {entry.name for entry in entries}
     
     # Check core files (must exist)
     missing_core_files = []
     for file in CORE_FILES:
-        file_path = os.path.join(REPO_PATH, file)
-        
         # Check if file exists
-        if not os.path.exists(file_path):
-            logger.warning(f"⚠️ Core file doesn't exist: {file}")
+        if file not in root_entries:
+            logger.warning("⚠️ Core file doesn't exist: %s", file)
             missing_core_files.append(file)
             continue
             
         # Check if file is tracked
         if file not in tracked_files:
-            logger.info(f"Adding core file: {file}")
+            logger.info("Adding core file: %s", file)
             run_command(f"git add {file}", REPO_PATH)
     
     # Check optional files (track if they exist)
     for file in OPTIONAL_FILES:
-        file_path = os.path.join(REPO_PATH, file)
-        
-        if os.path.exists(file_path) and file not in tracked_files:
-            logger.info(f"Adding optional file: {file}")
+        if file in root_entries and file not in tracked_files:
+            logger.info("Adding optional file: %s", file)
             run_command(f"git add {file}", REPO_PATH)
     
     # Check modules (only if modules directory exists)
-    modules_dir = os.path.join(REPO_PATH, "modules")
-    if os.path.exists(modules_dir):
+    if "modules" in root_entries:
         for module in MODULES:
             module_path = os.path.join(REPO_PATH, module)
             
             if os.path.exists(module_path) and module not in tracked_files:
-                logger.info(f"Adding module: {module}")
+                logger.info("Adding module: %s", module)
                 run_command(f"git add {module}", REPO_PATH)
     
     # Check assets (only if assets directory exists)
-    assets_dir = os.path.join(REPO_PATH, "assets")
-    if os.path.exists(assets_dir):
+    if "assets" in root_entries:
         for asset in ASSETS:
-            asset_path = os.path.join(REPO_PATH, asset)
-            
-            if os.path.exists(asset_path) and asset not in tracked_files:
-                logger.info(f"Adding asset: {asset}")
+            if asset.rstrip("/") in root_entries and asset not in tracked_files:
+                logger.info("Adding asset: %s", asset)
                 run_command(f"git add {asset}", REPO_PATH)
     
     if missing_core_files:
-        logger.warning(f"⚠️ Missing core files: {', '.join(missing_core_files)}")
+        logger.warning("⚠️ Missing core files: %s", ", ".join(missing_core_files))
         logger.info("💡 These files should be created for a complete project")
     
     return len(missing_core_files) == 0
@@ -311,7 +313,7 @@ def init_or_update_repo():
             if result and hasattr(result, 'stdout'):
                 current_url = result.stdout.strip()
                 if current_url != REMOTE_URL:
-                    logger.info(f"🔄 Updating remote URL from {current_url} to {REMOTE_URL}")
+                    logger.info("🔄 Updating remote URL from %s to %s", current_url, REMOTE_URL)
                     run_command(f"git remote set-url origin {REMOTE_URL}", REPO_PATH)
                 else:
                     logger.info("✅ Origin remote already configured correctly")
@@ -347,7 +349,7 @@ def init_or_update_repo():
 def pull_latest_changes():
     """Pull the latest changes from the remote repository."""
     branch = get_current_branch(REPO_PATH)
-    logger.info(f"⬇️ Pulling latest changes from {branch}")
+    logger.info("⬇️ Pulling latest changes from %s", branch)
     
     try:
         # First check if the remote repository exists and we can connect
@@ -363,7 +365,7 @@ def pull_latest_changes():
             logger.warning("⚠️ Remote repository not accessible or doesn't exist yet. Will try to push.")
             
     except GitSyncException as e:
-        logger.warning(f"⚠️ Pull encountered issues, continuing anyway: {str(e)}")
+        logger.warning("⚠️ Pull encountered issues, continuing anyway: %s", e)
 
 def commit_and_push():
     """Commit changes and push to the remote repository."""
@@ -381,12 +383,12 @@ def commit_and_push():
     run_command("git status --short", REPO_PATH)
     
     # Commit changes
-    logger.info(f"💾 Committing changes: {COMMIT_MESSAGE}")
+    logger.info("💾 Committing changes: %s", COMMIT_MESSAGE)
     run_command(f'git commit -m "{COMMIT_MESSAGE}"', REPO_PATH)
     
     # Push to remote
     branch = get_current_branch(REPO_PATH)
-    logger.info(f"⬆️ Pushing to {branch}")
+    logger.info("⬆️ Pushing to %s", branch)
     
     try:
         # Try a regular push first
@@ -399,7 +401,7 @@ def commit_and_push():
             run_command(f"git push -u origin {branch}", REPO_PATH)
             logger.info("✅ Successfully force pushed changes (initial setup)")
         except GitSyncException as e2:
-            logger.error(f"❌ Both push attempts failed: {str(e2)}")
+            logger.error("❌ Both push attempts failed: %s", e2)
             logger.error("💡 Make sure the repository exists on GitHub and you have push access")
             raise
 
@@ -426,7 +428,7 @@ def generate_changelog():
             with open(changelog_path, "w", encoding="utf-8") as f:
                 f.write(changelog)
                 
-            logger.info(f"✅ Changelog written to CHANGELOG.md")
+            logger.info("✅ Changelog written to CHANGELOG.md")
             
             # Add changelog to git
             run_command("git add CHANGELOG.md", REPO_PATH)
@@ -440,7 +442,7 @@ def main():
     """Main execution flow."""
     try:
         logger.info("🚀 Starting GitHub sync process")
-        logger.info(f"Repository path: {REPO_PATH}")
+        logger.info("Repository path: %s", REPO_PATH)
         
         # Initialize or update Git repository
         init_or_update_repo()
@@ -460,21 +462,22 @@ def main():
         logger.info("🎉 Sync completed successfully")
         
     except GitSyncException as e:
-        logger.error(f"❌ Sync failed: {str(e)}")
+        logger.error("❌ Sync failed: %s", e)
         return 1
         
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {str(e)}")
+        logger.error("❌ Unexpected error: %s", e)
         return 1
         
     return 0
 
 if __name__ == "__main__":
+    setup_logging()
     try:
         sys.exit(main())
     except KeyboardInterrupt:
         logger.info("⏹️ Process interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.critical(f"💥 Fatal error: {str(e)}", exc_info=True)
+        logger.critical("💥 Fatal error: %s", e, exc_info=True)
         sys.exit(1)
\ No newline at end of file
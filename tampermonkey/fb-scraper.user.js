@@ -26,7 +26,31 @@
             photos: false,         // Photo albums (slower)
             posts: false           // Recent posts (much slower)
         }
-    };    let currentDepth = GM_getValue('currentDepth', 1);
+    };
+
+    // Selectors and URL patterns shared by the extractors (built once, not per call)
+    const PROFILE_NAME_SELECTORS = [
+        'h1[data-overviewsection="true"]',
+        'h1',
+        '[data-testid="profile_header_name"]',
+        '.x1heor9g .x1qlqyl8',
+        '.profile-name'
+    ];
+    const FRIEND_LINK_SELECTOR = 'a[href*="/profile.php"], a[href*="facebook.com/"]:not([href*="photos"]):not([href*="videos"])';
+    // Content a resumed workflow step needs on the page before it can scrape (anything else waits for the header)
+    const STEP_READY_SELECTORS = {
+        about_page: '[data-overviewsection]:not(h1)', // The profile header h1 carries the attribute too
+        friends_list: FRIEND_LINK_SELECTOR
+    };
+    const PROFILE_PHP_URL_RE = /^(https?:\/\/[^\/]+\/profile\.php(?:\?id=\d+)?)/;
+    const USERNAME_URL_RE = /facebook\.com\/[^\/]+$/;
+    const NUMERIC_PROFILE_URL_RE = /profile\.php\?id=\d+/;
+    // Plain-text fallbacks for the About page (matchAll copies these, so sharing /g regexes is safe)
+    const ABOUT_WORK_PATTERNS = [/works at ([^\.]+)/gi, /employed at ([^\.]+)/gi];
+    const ABOUT_EDUCATION_PATTERNS = [/studied at ([^\.]+)/gi, /graduated from ([^\.]+)/gi];
+    const ABOUT_LOCATION_PATTERNS = [/lives in ([^\.]+)/gi, /from ([^\.]+)/gi];
+
+    let currentDepth = GM_getValue('currentDepth', 1);
     let isRunning = false;
     let debugPanel = null;
     let isScrapeAsNewSeed = false; // Flag to indicate we're scraping as a new seed
@@ -2135,8 +2159,7 @@
         
         if (currentUrl.includes('/profile.php')) {
             // Numerical profile: profile.php?id=123&sk=friends
-            const match = currentUrl.match(/profile\.php\?id=(\d+)/);
-            if (match) {
+            if (NUMERIC_PROFILE_URL_RE.test(currentUrl)) {
                 friendsUrl = `${currentUrl}&sk=friends`;
             }
         } else {
@@ -2159,8 +2182,7 @@
         
         if (currentUrl.includes('/profile.php')) {
             // Numerical profile: profile.php?id=123&sk=about
-            const match = currentUrl.match(/profile\.php\?id=(\d+)/);
-            if (match) {
+            if (NUMERIC_PROFILE_URL_RE.test(currentUrl)) {
                 aboutUrl = `${currentUrl}&sk=about`;
             }
         } else {
@@ -2180,15 +2202,7 @@
     // Extraction functions
     function extractProfileName() {
         // Try multiple selectors for profile name
-        const selectors = [
-            'h1[data-overviewsection="true"]',
-            'h1',
-            '[data-testid="profile_header_name"]',
-            '.x1heor9g .x1qlqyl8',
-            '.profile-name'
-        ];
-
-        for (const selector of selectors) {
+        for (const selector of PROFILE_NAME_SELECTORS) {
             const element = document.querySelector(selector);
             if (element && element.textContent.trim()) {
                 return element.textContent.trim();
@@ -2202,7 +2216,7 @@
         // For numerical profiles (profile.php), preserve the ID parameter
         if (url.includes('/profile.php')) {
             // Extract the base URL with ID parameter
-            const match = url.match(/^(https?:\/\/[^\/]+\/profile\.php(?:\?id=\d+)?)/);
+            const match = url.match(PROFILE_PHP_URL_RE);
             if (match) {
                 return match[1];
             }
@@ -2248,16 +2262,18 @@
             }
         }
 
-        // If no image found with specific selectors, try a broader search but with content filtering
-        const allImages = document.querySelectorAll('image, img');
-        for (const img of allImages) {
+        // If no image found with specific selectors, try a broader search but with content filtering.
+        // Only images inside the main content area are queried, rather than walking every image on the page.
+        const mainImages = document.querySelectorAll(
+            '[role="main"] image, [role="main"] img, [data-pagelet="ProfileTilesFeed"] image, [data-pagelet="ProfileTilesFeed"] img'
+        );
+        for (const img of mainImages) {
             const src = img.getAttribute('xlink:href') || img.src;
             if (src && src.startsWith('http') && src.includes('fbcdn.net')) {
-                // Check if it's in the main content area and not navigation
+                // Skip anything inside navigation
                 const isInNav = img.closest('[data-testid*="nav"], [role="navigation"], [data-pagelet*="nav"], [aria-label*="navigation"]');
-                const isInMain = img.closest('[role="main"], [data-pagelet="ProfileTilesFeed"]');
                 
-                if (isInMain && !isInNav) {
+                if (!isInNav) {
                     // Additional size check to ensure it's a profile picture
                     const width = img.getAttribute('width') || img.width;
                     const height = img.getAttribute('height') || img.height;
@@ -2278,29 +2294,24 @@
             work: [
                 '[data-overviewsection="work"]',
                 'div[class*="work"] span[dir="auto"]',
-                'div:contains("Work") + div span[dir="auto"]',
                 '[aria-label*="work"] span[dir="auto"]',
                 'div[class*="employment"] span'
             ],
             education: [
                 '[data-overviewsection="education"]',
                 'div[class*="education"] span[dir="auto"]',
-                'div:contains("Education") + div span[dir="auto"]',
                 '[aria-label*="education"] span[dir="auto"]',
                 'div[class*="school"] span'
             ],
             location: [
                 '[data-overviewsection="places"]',
                 'div[class*="location"] span[dir="auto"]',
-                'div:contains("Lives in") span[dir="auto"]',
-                'div:contains("From") span[dir="auto"]',
                 '[aria-label*="location"] span[dir="auto"]',
                 'div[class*="hometown"] span'
             ],
             contact: [
                 '[data-overviewsection="contact_basic_info"]',
                 'div[class*="contact"] span[dir="auto"]',
-                'div:contains("Contact") + div span[dir="auto"]',
                 '[aria-label*="contact"] span[dir="auto"]'
             ]
         };
@@ -2326,7 +2337,7 @@
                         }
                     }
                 } catch (e) {
-                    // Skip invalid selectors (like :contains which isn't standard CSS)
+                    // Skip selectors the browser rejects
                     continue;
                 }
             }
@@ -2342,25 +2353,21 @@
             
             // Look for common patterns in text content
             const allText = document.body.textContent;
-            const workPatterns = [/works at ([^\.]+)/gi, /employed at ([^\.]+)/gi];
-            const eduPatterns = [/studied at ([^\.]+)/gi, /graduated from ([^\.]+)/gi];
-            const locPatterns = [/lives in ([^\.]+)/gi, /from ([^\.]+)/gi];
-            
-            workPatterns.forEach(pattern => {
+            ABOUT_WORK_PATTERNS.forEach(pattern => {
                 const matches = [...allText.matchAll(pattern)];
                 if (matches.length > 0) {
                     about.work = matches.map(m => m[1].trim());
                 }
             });
             
-            eduPatterns.forEach(pattern => {
+            ABOUT_EDUCATION_PATTERNS.forEach(pattern => {
                 const matches = [...allText.matchAll(pattern)];
                 if (matches.length > 0) {
                     about.education = matches.map(m => m[1].trim());
                 }
             });
             
-            locPatterns.forEach(pattern => {
+            ABOUT_LOCATION_PATTERNS.forEach(pattern => {
                 const matches = [...allText.matchAll(pattern)];
                 if (matches.length > 0) {
                     about.location = matches.map(m => m[1].trim());
@@ -2378,7 +2385,7 @@
         // Scroll to load more friends
         await scrollToLoadMore();
 
-        const friendElements = document.querySelectorAll('a[href*="/profile.php"], a[href*="facebook.com/"]:not([href*="photos"]):not([href*="videos"])');
+        const friendElements = document.querySelectorAll(FRIEND_LINK_SELECTOR);
         
         const processedUrls = new Set();        friendElements.forEach(element => {
             const url = element.href;
@@ -2387,7 +2394,7 @@
 
             // Filter valid Facebook profile URLs and avoid duplicates
             if (url && name && 
-                (url.includes('/profile.php') || url.match(/facebook\.com\/[^\/]+$/)) &&
+                (url.includes('/profile.php') || USERNAME_URL_RE.test(url)) &&
                 !processedUrls.has(url) &&
                 name.length > 0 && name.length < 100) {
                 
@@ -2397,7 +2404,7 @@
                 let cleanUrl;
                 if (url.includes('/profile.php')) {
                     // For numerical profiles, preserve the ID parameter
-                    const match = url.match(/^(https?:\/\/[^\/]+\/profile\.php(?:\?id=\d+)?)/);
+                    const match = url.match(PROFILE_PHP_URL_RE);
                     cleanUrl = match ? match[1] : url.split('?')[0];
                 } else {
                     // For regular username profiles, remove query parameters
@@ -2415,20 +2422,41 @@
     }
 
     async function scrollToLoadMore() {
-        return new Promise((resolve) => {
-            let scrollCount = 0;
-            const maxScrolls = 5;
-            
-            const scrollInterval = setInterval(() => {
-                window.scrollTo(0, document.body.scrollHeight);
-                scrollCount++;
-                
-                if (scrollCount >= maxScrolls) {
-                    clearInterval(scrollInterval);
-                    setTimeout(resolve, 2000);
-                }
-            }, 1000);
-        });    }
+        const maxScrolls = 5;
+        const settleTimeout = 2000; // Longest wait for lazy-loaded friends after a scroll
+        const pollInterval = 200;
+        const maxStalledScrolls = 2; // A single slow load shouldn't end the list early
+        let stalledScrolls = 0;
+        
+        for (let scrollCount = 0; scrollCount < maxScrolls; scrollCount++) {
+            const previousHeight = document.body.scrollHeight;
+            window.scrollTo(0, previousHeight);
+            
+            // Wait only until the page grows instead of a fixed delay
+            let waited = 0;
+            while (document.body.scrollHeight <= previousHeight && waited < settleTimeout) {
+                await new Promise(resolve => setTimeout(resolve, pollInterval));
+                waited += pollInterval;
+            }
+            
+            // Nothing new loaded twice in a row - the list is exhausted, stop scrolling
+            if (document.body.scrollHeight > previousHeight) {
+                stalledScrolls = 0;
+            } else if (++stalledScrolls >= maxStalledScrolls) {
+                break;
+            }
+        }
+    }
+
+    // Resolve as soon as selector matches, or after timeout if it never does
+    async function waitForElement(selector, timeout = 3000, pollInterval = 200) {
+        let waited = 0;
+        while (!document.querySelector(selector) && waited < timeout) {
+            await new Promise(resolve => setTimeout(resolve, pollInterval));
+            waited += pollInterval;
+        }
+        return document.querySelector(selector);
+    }
 
     // API functions
     async function sendToAPI(endpoint, data, method = 'POST') {
@@ -2594,10 +2622,9 @@
             updateStatus(`Resuming workflow: ${state.workflow} - ${state.step}`, 'info');
             isRunning = true;
             
-            // Resume workflow after page elements load
-            setTimeout(() => {
-                continueWorkflow();
-            }, 3000);
+            // Resume as soon as the step's content has rendered, or after the old fixed 3s if it never shows
+            const readySelector = STEP_READY_SELECTORS[state.step] || 'h1';
+            waitForElement(readySelector, 3000).then(() => continueWorkflow());
         } else {
             updateStatus('Facebook Social Graph Scraper loaded', 'success');
             